@@ -44,6 +44,7 @@ __all__ = [
     "DataSaver",
     "QuantumEncoder",
     "LivePlotter",
+    "PyQtGraphLivePlotter",
     "cfg_from_settings",
     "Experiment1D",
     "__version__",
@@ -60,6 +61,10 @@ def __getattr__(name: str):
         return import_module("qeg_nmr_qua.analysis.data_saver").DataSaver
     if name == "LivePlotter":
         return import_module("qeg_nmr_qua.plotting.live_plotter").LivePlotter
+    if name == "PyQtGraphLivePlotter":
+        return import_module(
+            "qeg_nmr_qua.plotting.pyqtgraph_plotter"
+        ).PyQtGraphLivePlotter
     if name == "OPXConfig":
         return OPXConfig
     raise AttributeError(f"module {__name__} has no attribute {name}")
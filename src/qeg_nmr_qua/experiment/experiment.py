@@ -140,6 +140,7 @@ class Experiment:
             element (str): Element to which the pulse is applied. Must be defined in the config.
             phase (float | Iterable): Phase of the pulse in degrees. Saves as a fraction of 2pi.
             amplitude (float | Iterable): Amplitude of the pulse. This factor multiplies the waveform's defined amplitude.
+                A NumPy array sweep is used by reference rather than copied, so it should not be modified afterwards.
             length (int | Iterable): Length of the pulse in nanoseconds. This overrides the waveform's defined length.
         """
         if element not in self.config.elements.elements.keys():
@@ -173,7 +174,7 @@ class Experiment:
                 else self.config.elements.elements[element].operations[name].length // 4
             )
             command["phase"] = (phase / 360) % 1
-            self.update_loop(np.array(amplitude))
+            self.update_loop(np.asarray(amplitude))  # no copy when re-adding the same sweep
             self.use_fixed = True
         elif isinstance(length, Iterable):
             command["phase"] = (phase / 360) % 1
@@ -400,6 +401,7 @@ class Experiment:
         - settings.json: Experiment settings
         - commands.json: List of commands executed
         - data.json: Experimental results and metadata
+        - data.npz: NumPy arrays from the results (e.g. I and Q traces)
 
         Each experiment is saved in a newly created folder with a simple naming structure
         for easy loading elsewhere.
@@ -4,10 +4,11 @@ from qeg_nmr_qua.experiment.macros import (
     drive_mode,
 )
 from qeg_nmr_qua.experiment.experiment import Experiment
+from qeg_nmr_qua.plotting.live_plotter import NON_INTERACTIVE_BACKENDS
 
-import matplotlib.pyplot as plt
+import time
+import numpy as np
 from qualang_tools.results import fetching_tool, progress_counter
-from qualang_tools.plot import interrupt_on_close
 from qualang_tools.units import unit
 from qm.qua import (
     wait,
@@ -72,8 +73,7 @@ class Experiment1D(Experiment):
             Q1 = declare(fixed)
             I2 = declare(fixed)
             Q2 = declare(fixed)
-            I_st = declare_stream()
-            Q_st = declare_stream()
+            IQ_st = declare_stream()  # I and Q interleaved, split in stream processing
             t1 = declare(int)
             t2 = declare(int)
 
@@ -99,8 +99,8 @@ class Experiment1D(Experiment):
                         demod.full("rotated_cos", I1, "out1"),
                         demod.full("rotated_sin", Q1, "out1"),
                     )
-                    save(I1, I_st)
-                    save(Q1, Q_st)
+                    save(I1, IQ_st)
+                    save(Q1, IQ_st)
                     wait(self.loop_wait_cycles, self.probe_key)
                 wait(
                     self.loop_wait_cycles, self.helper_key
@@ -112,8 +112,8 @@ class Experiment1D(Experiment):
                         demod.full("rotated_cos", I2, "out1"),
                         demod.full("rotated_sin", Q2, "out1"),
                     )
-                    save(I2, I_st)
-                    save(Q2, Q_st)
+                    save(I2, IQ_st)
+                    save(Q2, IQ_st)
                     wait(self.loop_wait_cycles, self.helper_key)
 
                 # set to safe mode and allow system to relax
@@ -123,53 +123,84 @@ class Experiment1D(Experiment):
 
             with stream_processing():
                 n_st.save("iteration")
-                I_st.buffer(self.measure_sequence_len).average().save("I")
-                Q_st.buffer(self.measure_sequence_len).average().save("Q")
+                IQ_st.buffer(2).buffer(self.measure_sequence_len).average().save("IQ")
 
         return experiment
 
     def live_data_processing(self, qm, job):
+        # imported here so that importing the package does not load a GUI backend
+        import matplotlib.pyplot as plt
+        from qualang_tools.plot import interrupt_on_close
+
         # Fetching tool
         results = fetching_tool(
             job,
-            data_list=["I", "Q", "iteration"],
+            data_list=["IQ", "iteration"],
             mode="live",
         )
 
         fig_live, (ax1, ax2) = plt.subplots(2, 1, sharex=True, height_ratios=[0, 1])
         ax1.set_visible(False)
         interrupt_on_close(fig_live, job)
+        plt.show(block=False)
+
+        # each fetch-and-redraw pass is throttled to at most one per min_interval
+        min_interval = 0.2  # seconds
+
+        # demod -> volts is a linear scaling, applied in place into a reused buffer
+        volts_scale = u.demod2volts(1.0, self.readout_len)
+        IQ_volts = np.empty((self.measure_sequence_len, 2))
+        I, Q = IQ_volts[..., 0], IQ_volts[..., 1]
+
+        def update_figure(IQ, iteration):
+            """Convert the averaged IQ trace to volts and redraw it."""
+            # stream processing averages on the OPX; only one trace is fetched
+            assert IQ.shape == (
+                self.measure_sequence_len,
+                2,
+            ), "IQ stream is not averaged on the OPX"
+            np.multiply(IQ, volts_scale, out=IQ_volts)
+
+            ax2.cla()
+            fig_live.suptitle(f"Good title, scan {iteration+1}/{self.n_avg}")
+            ax2.plot(
+                (self.tau_sweep) / u.us,
+                I * 1e6,
+                label=f"I Resonator {self.probe_key}",
+            )
+            ax2.plot(
+                (self.tau_sweep) / u.us,
+                Q * 1e6,
+                label=f"Q Resonator {self.probe_key}",
+            )
+            ax2.set_ylabel("I&Q (µV)")
+            ax2.set_xlabel("Acquisition time (µs)")
+            ax2.legend()
+            fig_live.tight_layout()
+            fig_live.canvas.draw_idle()
+
         try:
             while results.is_processing():
-                I, Q, iteration = results.fetch_all()
+                frame_start = time.monotonic()
+                IQ, iteration = results.fetch_all()
                 progress_counter(iteration, self.n_avg, start_time=results.start_time)
+                update_figure(IQ, iteration)
 
-                # Convert results into Volts
-                I = u.demod2volts(I, self.readout_len)
-                Q = u.demod2volts(Q, self.readout_len)
-
-                ax2.cla()
-                fig_live.suptitle(f"Good title, scan {iteration+1}/{self.n_avg}")
-                ax2.plot(
-                    (self.tau_sweep) / u.us,
-                    I * 1e6,
-                    label=f"I Resonator {self.probe_key}",
-                )
-                ax2.plot(
-                    (self.tau_sweep) / u.us,
-                    Q * 1e6,
-                    label=f"Q Resonator {self.probe_key}",
-                )
-                ax2.set_ylabel("I&Q (µV)")
-                ax2.set_xlabel("Acquisition time (µs)")
-                ax2.legend()
-                fig_live.tight_layout()
-                fig_live.canvas.draw_idle()
-                plt.pause(0.25)
+                # is_processing() does not sleep, so wait out the rest of the interval
+                # in the GUI event loop, which keeps the window responsive
+                remaining = min_interval - (time.monotonic() - frame_start)
+                if remaining > 0:
+                    fig_live.canvas.start_event_loop(remaining)
+                else:
+                    fig_live.canvas.flush_events()
 
         except KeyboardInterrupt:
             print("Experiment interrupted by user.")
 
+        # the last pass may predate the final averages, so fetch and draw them once more
+        IQ, iteration = results.fetch_all()
+        update_figure(IQ, iteration)
+
         # Keep the interactive plot open after acquisition until the user closes it
         message = "Acquisition finished. Close the plot window to continue."
         print(message)
@@ -187,11 +218,19 @@ class Experiment1D(Experiment):
             fig_live.canvas.draw_idle()
         except Exception as e:
             print(e)
-        while plt.fignum_exists(fig_live.number):
-            plt.pause(0.5)
 
         self.save_data_dict.update({"I_data": I})
         self.save_data_dict.update({"Q_data": Q})
         self.save_data_dict.update({"fig_live": fig_live})
 
+        # block without polling until the user closes fig_live; other open figures
+        # do not keep the experiment waiting. Headless backends have no window to
+        # close, and a window closed during acquisition needs no waiting either.
+        interactive = plt.get_backend().lower() not in NON_INTERACTIVE_BACKENDS
+        if interactive and plt.fignum_exists(fig_live.number):
+            fig_live.canvas.mpl_connect(
+                "close_event", lambda event: fig_live.canvas.stop_event_loop()
+            )
+            fig_live.canvas.start_event_loop(0)
+
         self.save_data()
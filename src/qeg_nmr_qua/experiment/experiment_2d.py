@@ -4,11 +4,12 @@ from qeg_nmr_qua.experiment.macros import (
     drive_mode,
 )
 from qeg_nmr_qua.experiment.experiment import Experiment
+from qeg_nmr_qua.plotting.live_plotter import NON_INTERACTIVE_BACKENDS
 
 
-import matplotlib.pyplot as plt
+import time
+import numpy as np
 from qualang_tools.results import fetching_tool, progress_counter
-from qualang_tools.plot import interrupt_on_close
 from qualang_tools.units import unit
 from qualang_tools.loops import from_array
 from qm.qua import (
@@ -76,8 +77,7 @@ class Experiment2D(Experiment):
             Q1 = declare(fixed)
             I2 = declare(fixed)
             Q2 = declare(fixed)
-            I_st = declare_stream()
-            Q_st = declare_stream()
+            IQ_st = declare_stream()  # I and Q interleaved, split in stream processing
             t1 = declare(int)
             t2 = declare(int)
             var = declare(fixed)
@@ -110,8 +110,8 @@ class Experiment2D(Experiment):
                             demod.full("rotated_cos", I1, "out1"),
                             demod.full("rotated_sin", Q1, "out1"),
                         )
-                        save(I1, I_st)
-                        save(Q1, Q_st)
+                        save(I1, IQ_st)
+                        save(Q1, IQ_st)
                         wait(self.loop_wait_cycles, self.probe_key)
                     wait(
                         self.loop_wait_cycles, self.helper_key
@@ -123,88 +123,136 @@ class Experiment2D(Experiment):
                             demod.full("rotated_cos", I2, "out1"),
                             demod.full("rotated_sin", Q2, "out1"),
                         )
-                        save(I2, I_st)
-                        save(Q2, Q_st)
+                        save(I2, IQ_st)
+                        save(Q2, IQ_st)
                         wait(self.loop_wait_cycles, self.helper_key)
                     safe_mode(switch=self.rx_switch_key, amplifier=self.amplifier_key)
                     wait(self.wait_between_scans, self.probe_key)
 
                 save(n, n_st)
 
+            nvar = len(self.var_vec)
+            mlen = self.measure_sequence_len
             with stream_processing():
                 n_st.save("iteration")
-                I_st.buffer(self.measure_sequence_len).buffer(
-                    len(self.var_vec)
-                ).average().save("I")
-                Q_st.buffer(self.measure_sequence_len).buffer(
-                    len(self.var_vec)
-                ).average().save("Q")
+                IQ_st.buffer(2).buffer(mlen).buffer(nvar).average().save("IQ")
 
         return experiment
 
     def live_data_processing(self, qm, job):
+        # imported here so that importing the package does not load a GUI backend
+        import matplotlib.pyplot as plt
+        from qualang_tools.plot import interrupt_on_close
+
         # Fetching tool
         results = fetching_tool(
             job,
-            data_list=["I", "Q", "iteration"],
+            data_list=["IQ", "iteration"],
             mode="live",
         )
 
         fig_live, (ax1, ax2, ax3) = plt.subplots(1, 3, sharex=False, figsize=(12, 4))
         interrupt_on_close(fig_live, job)
+        plt.show(block=False)
+
+        # each fetch-and-redraw pass is throttled to at most one per min_interval
+        min_interval = 0.2  # seconds
+
+        # plot axes are fixed for the whole acquisition
+        tau_us = np.asarray(self.tau_sweep) / u.us
+        axis = np.asarray(self.var_vec)
+
+        # demod -> volts is a linear scaling, applied in place into a reused buffer
+        volts_scale = u.demod2volts(1.0, self.readout_len)
+        IQ_volts = np.empty((len(self.var_vec), self.measure_sequence_len, 2))
+        I, Q = IQ_volts[..., 0], IQ_volts[..., 1]
+        # (I|Q, delay, sweep) in µV, laid out contiguously for the color plots
+        IQ_uV_T = np.empty((2, self.measure_sequence_len, len(self.var_vec)))
+        I_uV_T, Q_uV_T = IQ_uV_T
+
+        # primary signal trace is created on the first frame and updated in place
+        line3 = None
+        ax3.set_xlabel("Swept Variable")
+        ax3.set_ylabel("I (µV)")
+        ax3.set_title("Primary signal")
+
+        def update_figure(IQ):
+            """Convert the averaged IQ traces to volts and redraw them."""
+            nonlocal line3
+            # stream processing averages on the OPX; only one trace per point is fetched
+            assert IQ.shape == (
+                len(self.var_vec),
+                self.measure_sequence_len,
+                2,
+            ), "IQ stream is not averaged on the OPX"
+            np.multiply(IQ, volts_scale, out=IQ_volts)
+            np.multiply(IQ_volts.transpose(2, 1, 0), 1e6, out=IQ_uV_T)
+
+            # 2D color plot: pulse amplitude vs I
+            ax1.cla()
+            im1 = ax1.pcolormesh(
+                axis,
+                tau_us,
+                I_uV_T,
+                shading="auto",
+                cmap="viridis",
+            )
+            ax1.set_ylabel("Delay (µs)")
+            ax1.set_xlabel("Swept Variable")
+            ax1.set_title("I")
+            if not hasattr(ax1, "_colorbar"):
+                ax1._colorbar = plt.colorbar(im1, ax=ax1, label="I (V)")
+            else:
+                ax1._colorbar.update_normal(im1)
+
+            # 2D color plot: pulse amplitude vs tau for Q
+            ax2.cla()
+            im2 = ax2.pcolormesh(
+                axis,
+                tau_us,
+                Q_uV_T,
+                shading="auto",
+                cmap="viridis",
+            )
+            ax2.set_ylabel("Delay (µs)")
+            ax2.set_xlabel("Swept Variable")
+            ax2.set_title("Q")
+            if not hasattr(ax2, "_colorbar"):
+                ax2._colorbar = plt.colorbar(im2, ax=ax2, label="Q (µV)")
+            else:
+                ax2._colorbar.update_normal(im2)
+
+            if line3 is None:
+                (line3,) = ax3.plot(axis, I_uV_T[0], label="I")
+                ax3.legend()
+            else:
+                line3.set_ydata(I_uV_T[0])
+                ax3.relim()
+                ax3.autoscale_view()
+            fig_live.canvas.draw_idle()
+
         try:
             while results.is_processing():
-                I, Q, iteration = results.fetch_all()
+                frame_start = time.monotonic()
+                IQ, iteration = results.fetch_all()
                 progress_counter(iteration, self.n_avg, start_time=results.start_time)
+                update_figure(IQ)
 
-                # Convert results into Volts
-                I = u.demod2volts(I, self.readout_len)
-                Q = u.demod2volts(Q, self.readout_len)
-
-                # 2D color plot: pulse amplitude vs I
-                ax1.cla()
-                im1 = ax1.pcolormesh(
-                    self.var_vec,
-                    self.tau_sweep / u.us,
-                    I.T * 1e6,
-                    shading="auto",
-                    cmap="viridis",
-                )
-                ax1.set_ylabel("Delay (µs)")
-                ax1.set_xlabel("Swept Variable")
-                ax1.set_title("I")
-                if not hasattr(ax1, "_colorbar"):
-                    ax1._colorbar = plt.colorbar(im1, ax=ax1, label="I (V)")
-                else:
-                    ax1._colorbar.update_normal(im1)
-
-                # 2D color plot: pulse amplitude vs tau for Q
-                ax2.cla()
-                im2 = ax2.pcolormesh(
-                    self.var_vec,
-                    self.tau_sweep / u.us,
-                    Q.T * 1e6,
-                    shading="auto",
-                    cmap="viridis",
-                )
-                ax2.set_ylabel("Delay (µs)")
-                ax2.set_xlabel("Swept Variable")
-                ax2.set_title("Q")
-                if not hasattr(ax2, "_colorbar"):
-                    ax2._colorbar = plt.colorbar(im2, ax=ax2, label="Q (µV)")
+                # is_processing() does not sleep, so wait out the rest of the interval
+                # in the GUI event loop, which keeps the window responsive
+                remaining = min_interval - (time.monotonic() - frame_start)
+                if remaining > 0:
+                    fig_live.canvas.start_event_loop(remaining)
                 else:
-                    ax2._colorbar.update_normal(im2)
-
-                ax3.cla()
-                ax3.plot(self.var_vec, I.T[0] * 1e6, label="I")
-                ax3.set_xlabel("Swept Variable")
-                ax3.set_ylabel("I (µV)")
-                ax3.set_title("Primary signal")
-                ax3.legend()
+                    fig_live.canvas.flush_events()
 
         except KeyboardInterrupt:
             print("Experiment interrupted by user.")
 
+        # the last pass may predate the final averages, so fetch and draw them once more
+        IQ, iteration = results.fetch_all()
+        update_figure(IQ)
+
         # Keep the interactive plot open after acquisition until the user closes it
         message = "Acquisition finished. Close the plot window to continue."
         print(message)
@@ -222,11 +270,19 @@ class Experiment2D(Experiment):
             fig_live.canvas.draw_idle()
         except Exception as e:
             print(e)
-        while plt.fignum_exists(fig_live.number):
-            plt.pause(0.5)
 
         self.save_data_dict.update({"I_data": I})
         self.save_data_dict.update({"Q_data": Q})
         self.save_data_dict.update({"fig_live": fig_live})
 
+        # block without polling until the user closes fig_live; other open figures
+        # do not keep the experiment waiting. Headless backends have no window to
+        # close, and a window closed during acquisition needs no waiting either.
+        interactive = plt.get_backend().lower() not in NON_INTERACTIVE_BACKENDS
+        if interactive and plt.fignum_exists(fig_live.number):
+            fig_live.canvas.mpl_connect(
+                "close_event", lambda event: fig_live.canvas.stop_event_loop()
+            )
+            fig_live.canvas.start_event_loop(0)
+
         self.save_data()
@@ -10,7 +10,7 @@ def drive_mode(switch, amplifier):
     """
     Configures the hardware such that the receiver switch does not
     allow signal to pass through, and the amplifier is turned on and
-    unblanked, ready for driving the system. This adds 4 align() calls
+    unblanked, ready for driving the system. This adds 3 align() calls
     and 730 clock cycles of wait time.
     """
     align()
@@ -18,7 +18,7 @@ def drive_mode(switch, amplifier):
     align()
     wait(RX_SWITCH_DELAY)  # Switching time
     play("voltage_on", amplifier)  # Turn on the amplifier
-    align()
+    # the closing align() syncs every element to the end of the unblanking wait
     wait(AMPLIFIER_UNBLANKING_TIME)  # Max characteristic unblanking time
     align()
 
@@ -27,14 +27,14 @@ def readout_mode(switch, amplifier):
     """
     Configures the hardware such that the receiver switch allows signal
     to pass through, and the amplifier off (blanked) for reading out the
-    resonator. This adds 4 align() calls and 730 clock cycles of wait time.
+    resonator. This adds 3 align() calls and 730 clock cycles of wait time.
     """
     align()
     play("voltage_off", amplifier)  # Ensure Amplifier is off
     align()
     wait(AMPLIFIER_BLANKING_TIME)
     play("voltage_on", switch)  # Close the switch
-    align()
+    # the closing align() syncs every element to the end of the switching wait
     wait(RX_SWITCH_DELAY)
     align()
 
@@ -49,6 +49,6 @@ def safe_mode(switch, amplifier):
     play("voltage_off", switch)  # Ensure Switch is open
     align()
     play("voltage_off", amplifier)  # Turn off the amplifier
-    align()
+    # the closing align() syncs every element to the end of the blanking wait
     wait(AMPLIFIER_BLANKING_TIME)
     align()
@@ -0,0 +1,653 @@
+"""
+Live Plotting Module.
+
+This module provides a small wrapper around matplotlib for updating line plots
+while an experiment is running on the OPX-1000, such as progressively averaged
+FID traces or sweep results streamed point by point.
+"""
+
+import math
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from qeg_nmr_qua.plotting.point_buffer import PointBuffer
+
+# matplotlib is imported on first use, so importing this module does not load pyplot
+
+# initial capacity of the point buffer of a line without ``max_points``
+DEFAULT_BUFFER_CAPACITY = 1024
+# matplotlib backends that only render to files, with no window to update
+NON_INTERACTIVE_BACKENDS = frozenset({"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"})
+# replaced data rescales a subplot once its padded span is below this fraction of the view
+VIEW_SHRINK_FRACTION = 0.5
+
+
+class LivePlotter:
+    """Manage a figure of named subplots and lines that update during acquisition.
+
+    Subplots are stacked vertically in the order they are created, and each line
+    belongs to exactly one subplot. Lines can either be replaced wholesale with
+    :meth:`update_line`, or grown one sample at a time with :meth:`append_point`
+    or one block of samples at a time with :meth:`extend_points`.
+
+    **Batched Redraws:**
+
+    Every update requests a canvas redraw. When several lines change per
+    acquisition step, wrap the updates in :meth:`batching` (or use
+    :meth:`update_lines`) so the canvas is redrawn once for the whole batch.
+
+    **Blitting:**
+
+    Lines are animated artists. On backends that support blitting, a redraw only
+    restores the cached background of each subplot (axes, ticks, grid, labels)
+    and draws the lines on top of it. The full figure is redrawn, and the
+    backgrounds recaptured, only when a subplot's limits change or the layout
+    is rebuilt.
+
+    On non-interactive backends such as Agg (headless runs and CI), there is no
+    window to update, so updates skip rendering altogether. The figure is
+    rendered when it is saved with :meth:`save_figure`. Such figures are created
+    directly on an Agg canvas rather than through pyplot, so they are not
+    registered with pyplot's figure manager.
+
+    **Autoscaling:**
+
+    Each line keeps running bounds of its finite data (NaN and inf samples are
+    ignored), so rescaling never walks the stored lines. Since new samples usually
+    fall inside the current view during acquisition, the view limits are cached
+    and the subplot is only rescaled, to the union of its line bounds plus the axes
+    margins, when incoming data falls outside them. When a line is replaced with
+    :meth:`update_line`, cleared, or its ring of ``max_points`` samples drops a
+    sample that was on one of its bounds, the view also shrinks to the remaining data
+    once it would fill less than ``VIEW_SHRINK_FRACTION`` of the view, so a
+    decaying averaged trace is not left zoomed out at its first-scan range.
+
+    **Point Buffers:**
+
+    Every line owns a preallocated
+    :class:`~qeg_nmr_qua.plotting.point_buffer.PointBuffer` for its points, so
+    streaming samples with :meth:`append_point` costs O(1) per point instead of
+    copying the full history on every call:
+
+    - Without ``max_points``, the buffer starts with room for ``capacity`` points
+      and doubles its capacity when full.
+    - With ``max_points``, the buffer is a ring holding the most recent
+      ``max_points`` samples, always visible as a contiguous, chronologically
+      ordered view.
+
+    Buffers are stored as ``float64``, so large x values such as timestamps keep
+    their full precision.
+
+    Matplotlib copies the data it is given, so appended samples are only handed
+    to the line when it is next drawn. Inside :meth:`batching`, any number of
+    appends to a line cost a single copy.
+
+    Attributes:
+        title (str): Title shown above all subplots.
+        figsize (tuple[float, float]): Figure size in inches.
+        fig (matplotlib.figure.Figure | None): The figure, created with the first subplot.
+        axes (dict[str, matplotlib.axes.Axes]): Subplots by name.
+        lines (dict[str, matplotlib.lines.Line2D]): Lines by name.
+
+    Example:
+        >>> plotter = LivePlotter(title="FID")
+        >>> plotter.create_subplot("fid", xlabel="Time (µs)", ylabel="Signal (µV)")
+        >>> plotter.add_line("fid", "I", color="tab:blue", label="I")
+        >>> for t, v in stream:
+        ...     plotter.append_point("I", t, v)
+        >>> plotter.save_figure("fid.png")
+        >>> plotter.close()
+    """
+
+    def __init__(self, title: str = "Live Plot", figsize: tuple[float, float] = (10, 6)):
+        """Initialize the plotter. The figure is created lazily with the first subplot.
+
+        Args:
+            title (str): Title shown above all subplots (default: "Live Plot").
+            figsize (tuple[float, float]): Figure size in inches (default: (10, 6)).
+        """
+        self.title = title
+        self.figsize = figsize
+        self.fig = None
+        self.axes: dict[str, Any] = {}
+        self.lines: dict[str, Any] = {}
+        self._line_axes: dict[str, str] = {}  # line name -> subplot name
+        self._buffers: dict[str, PointBuffer] = {}  # line name -> point buffer
+        self._pending: set[str] = set()  # lines whose buffer is newer than their data
+        self._batch_depth = 0  # > 0 while inside batching()
+        self._backgrounds: dict[str, Any] = {}  # subplot name -> cached background
+        self._needs_full_draw = True  # set when the cached backgrounds are stale
+        self._interactive = True  # whether the backend shows a window, set with the figure
+        # subplot name -> (xmin, xmax, ymin, ymax) after the last autoscale
+        self._view_limits: dict[str, tuple[float, float, float, float]] = {}
+        # line name -> (xmin, xmax, ymin, ymax) of the finite data of the line
+        self._line_bounds: dict[str, tuple[float, float, float, float]] = {}
+        # subplot name -> union of the bounds of its lines
+        self._data_bounds: dict[str, tuple[float, float, float, float]] = {}
+
+    def _ensure_figure(self):
+        """Create the figure on first use and return it."""
+        if self.fig is None:
+            import matplotlib
+
+            self._interactive = matplotlib.get_backend().lower() not in NON_INTERACTIVE_BACKENDS
+            if self._interactive:
+                import matplotlib.pyplot as plt
+
+                self.fig = plt.figure(figsize=self.figsize)
+            else:
+                # no window to manage, so bypass pyplot and its figure registry
+                from matplotlib.backends.backend_agg import FigureCanvasAgg
+                from matplotlib.figure import Figure
+
+                self.fig = Figure(figsize=self.figsize)
+                FigureCanvasAgg(self.fig)
+            self.fig.suptitle(self.title)
+            self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+        return self.fig
+
+    def _on_draw(self, event) -> None:
+        """Recapture the subplot backgrounds after a full redraw and draw the lines.
+
+        Draws by canvases that cannot blit, such as the PDF or SVG canvases that
+        ``savefig`` renders vector formats with, have no background to capture.
+        """
+        canvas = event.canvas
+        if not canvas.supports_blit:
+            return
+        self._backgrounds = {
+            name: canvas.copy_from_bbox(ax.bbox) for name, ax in self.axes.items()
+        }
+        self._needs_full_draw = False
+        for line_name, line in self.lines.items():
+            # save_figure renders the lines as static artists, already drawn
+            if line.get_animated():
+                self.axes[self._line_axes[line_name]].draw_artist(line)
+
+    def _invalidate_backgrounds(self, *args) -> None:
+        """Mark the cached backgrounds as stale, forcing a full redraw on next refresh."""
+        self._needs_full_draw = True
+
+    def create_subplot(
+        self, name: str, xlabel: str = "", ylabel: str = "", title: str = ""
+    ) -> None:
+        """Add a subplot below the existing ones.
+
+        Args:
+            name (str): Unique name used to refer to the subplot.
+            xlabel (str): X-axis label.
+            ylabel (str): Y-axis label.
+            title (str): Subplot title.
+
+        Raises:
+            ValueError: If a subplot with this name already exists.
+        """
+        if name in self.axes:
+            raise ValueError(f"Subplot '{name}' already exists.")
+        fig = self._ensure_figure()
+        from matplotlib.gridspec import GridSpec
+
+        # re-grid the existing subplots to make room for the new one
+        n_rows = len(self.axes) + 1
+        grid = GridSpec(n_rows, 1, figure=fig)
+        for row, ax in enumerate(self.axes.values()):
+            ax.set_subplotspec(grid[row])
+
+        ax = fig.add_subplot(grid[n_rows - 1])
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.grid(True)
+        # new limits mean new ticks, so the cached background must be redrawn
+        ax.callbacks.connect("xlim_changed", self._invalidate_backgrounds)
+        ax.callbacks.connect("ylim_changed", self._invalidate_backgrounds)
+        self.axes[name] = ax
+        self._invalidate_backgrounds()
+
+    def add_line(
+        self,
+        subplot_name: str,
+        line_name: str,
+        color: str | None = None,
+        label: str | None = None,
+        max_points: int | None = None,
+        capacity: int | None = None,
+    ) -> None:
+        """Add an empty line to a subplot.
+
+        Args:
+            subplot_name (str): Name of the subplot the line is drawn on.
+            line_name (str): Unique name used to refer to the line.
+            color (str | None): Matplotlib color, or None for the next cycle color.
+            label (str | None): Legend label. A legend is shown if given.
+            max_points (int | None): Keep only the most recent ``max_points`` samples.
+                None keeps the full history.
+            capacity (int | None): Number of points to preallocate for a line without
+                ``max_points``, e.g. the expected trace length. None uses
+                ``DEFAULT_BUFFER_CAPACITY``.
+
+        Raises:
+            ValueError: If the subplot does not exist, the line name is taken,
+                or ``max_points`` or ``capacity`` is not positive.
+        """
+        self._validate_new_line(subplot_name, line_name, max_points, capacity)
+
+        ax = self.axes[subplot_name]
+        (line,) = ax.plot([], [], color=color, label=label, animated=True)
+        if label is not None:
+            ax.legend()
+            self._invalidate_backgrounds()
+
+        self._register_line(subplot_name, line_name, line, max_points, capacity)
+
+    def _validate_new_line(
+        self,
+        subplot_name: str,
+        line_name: str,
+        max_points: int | None,
+        capacity: int | None = None,
+    ) -> None:
+        """Check the arguments of :meth:`add_line`, raising a ValueError if they are invalid."""
+        if subplot_name not in self.axes:
+            raise ValueError(f"Subplot '{subplot_name}' does not exist.")
+        if line_name in self.lines:
+            raise ValueError(f"Line '{line_name}' already exists.")
+        if max_points is not None and max_points < 1:
+            raise ValueError("max_points must be a positive integer.")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive integer.")
+
+    def _register_line(
+        self,
+        subplot_name: str,
+        line_name: str,
+        line: Any,
+        max_points: int | None,
+        capacity: int | None = None,
+    ) -> None:
+        """Store a new line and allocate its point buffer."""
+        self.lines[line_name] = line
+        self._line_axes[line_name] = subplot_name
+        self._buffers[line_name] = PointBuffer(
+            capacity or DEFAULT_BUFFER_CAPACITY, max_points=max_points
+        )
+
+    def _get_line(self, line_name: str):
+        """Return the line with the given name, raising a ValueError if it is unknown."""
+        if line_name not in self.lines:
+            raise ValueError(f"Line '{line_name}' does not exist.")
+        return self.lines[line_name]
+
+    def update_line(
+        self, line_name: str, x_data: np.ndarray, y_data: np.ndarray, autoscale: bool = True
+    ) -> None:
+        """Replace the data of a line.
+
+        Subsequent calls to :meth:`append_point` continue from this data.
+
+        Args:
+            line_name (str): Name of the line.
+            x_data (np.ndarray): New x values.
+            y_data (np.ndarray): New y values, same length as ``x_data``.
+            autoscale (bool): Rescale the subplot if the new data falls outside the
+                current view (default: True).
+
+        Raises:
+            ValueError: If the line does not exist or the data lengths differ.
+        """
+        line = self._get_line(line_name)
+        x_data = np.asarray(x_data, dtype=float)
+        y_data = np.asarray(y_data, dtype=float)
+        if x_data.shape != y_data.shape:
+            raise ValueError("x_data and y_data must have the same shape.")
+
+        buf = self._buffers[line_name]
+        if buf.max_points is not None:
+            x_data = x_data[-buf.max_points :]
+            y_data = y_data[-buf.max_points :]
+        buf.load(x_data, y_data)
+
+        self._pending.discard(line_name)
+        self._set_line_data(line, x_data, y_data)
+        if autoscale:
+            self._autoscale(line_name, self._finite_bounds(x_data, y_data), replace=True)
+        self._refresh()
+
+    def update_lines(
+        self, updates: dict[str, tuple[np.ndarray, np.ndarray]], autoscale: bool = True
+    ) -> None:
+        """Replace the data of several lines with a single redraw.
+
+        Args:
+            updates (dict[str, tuple[np.ndarray, np.ndarray]]): Mapping of line names
+                to ``(x_data, y_data)``.
+            autoscale (bool): Rescale the affected subplots (default: True).
+
+        Raises:
+            ValueError: If any line does not exist or its data lengths differ.
+        """
+        with self.batching():
+            for line_name, (x_data, y_data) in updates.items():
+                self.update_line(line_name, x_data, y_data, autoscale=autoscale)
+
+    def append_point(self, line_name: str, x: float, y: float, autoscale: bool = True) -> None:
+        """Append a single sample to a line.
+
+        For samples that arrive in blocks, :meth:`extend_points` avoids the per-call
+        overhead of appending them one by one.
+
+        Args:
+            line_name (str): Name of the line.
+            x (float): X value of the sample.
+            y (float): Y value of the sample.
+            autoscale (bool): Rescale the subplot if the sample falls outside the
+                current view (default: True).
+
+        Raises:
+            ValueError: If the line does not exist.
+        """
+        self._get_line(line_name)
+        buf = self._buffers[line_name]
+        evicted = buf.next_evicted()
+        buf.append(x, y)
+
+        # the line is updated from the buffer when it is next drawn
+        self._pending.add(line_name)
+        if autoscale:
+            bounds = self._line_bounds.get(line_name)
+            if evicted is not None and bounds is not None and (
+                evicted[0] in bounds[:2] or evicted[1] in bounds[2:]
+            ):
+                # the sample that left the ring was on a bound, which may now shrink
+                self._autoscale(line_name, self._finite_bounds(*buf.view()), replace=True)
+            elif math.isfinite(x) and math.isfinite(y):
+                self._autoscale(line_name, (x, x, y, y))
+        self._refresh()
+
+    def extend_points(
+        self, line_name: str, x_data: np.ndarray, y_data: np.ndarray, autoscale: bool = True
+    ) -> None:
+        """Append a block of samples to a line, with a single buffer write and redraw.
+
+        Equivalent to calling :meth:`append_point` for each sample, but the samples
+        are copied into the point buffer in one vectorized write. Prefer it when
+        samples arrive in blocks, e.g. one chunk per stream fetch.
+
+        Args:
+            line_name (str): Name of the line.
+            x_data (np.ndarray): X values of the new samples.
+            y_data (np.ndarray): Y values of the new samples, same length as ``x_data``.
+            autoscale (bool): Rescale the subplot if the samples fall outside the
+                current view (default: True).
+
+        Raises:
+            ValueError: If the line does not exist or the data lengths differ.
+        """
+        self._get_line(line_name)
+        x_data = np.asarray(x_data, dtype=float)
+        y_data = np.asarray(y_data, dtype=float)
+        if x_data.shape != y_data.shape:
+            raise ValueError("x_data and y_data must have the same shape.")
+        if not x_data.size:
+            return
+
+        buf = self._buffers[line_name]
+        evicts = buf.max_points is not None and buf.n + x_data.size > buf.cap
+        buf.extend(x_data, y_data)
+        self._pending.add(line_name)
+        if autoscale:
+            if evicts:
+                # samples left the ring, so the bounds of the line may shrink
+                self._autoscale(line_name, self._finite_bounds(*buf.view()), replace=True)
+            else:
+                self._autoscale(line_name, self._finite_bounds(x_data, y_data))
+        self._refresh()
+
+    def clear_line(self, line_name: str) -> None:
+        """Remove all data from a line.
+
+        Args:
+            line_name (str): Name of the line.
+
+        Raises:
+            ValueError: If the line does not exist.
+        """
+        line = self._get_line(line_name)
+        self._buffers[line_name].clear()
+        self._pending.discard(line_name)
+        self._set_line_data(line, [], [])
+        self._autoscale(line_name, None, replace=True)
+        self._refresh()
+
+    @staticmethod
+    def _set_line_data(line: Any, x_data: np.ndarray, y_data: np.ndarray) -> None:
+        """Hand new data to a line artist."""
+        line.set_data(x_data, y_data)
+
+    def _flush_pending(self) -> None:
+        """Hand the buffered points of lines with new appended samples to their artists."""
+        for line_name in self._pending:
+            self._set_line_data(self.lines[line_name], *self._buffers[line_name].view())
+        self._pending.clear()
+
+    def _autoscale(
+        self,
+        line_name: str,
+        bounds: tuple[float, float, float, float] | None,
+        replace: bool = False,
+    ) -> None:
+        """Record the data bounds of a line and rescale its subplot if needed.
+
+        The view grows whenever the data leaves it. When a line is replaced or
+        cleared, the subplot bounds are recomputed from its lines, and the view
+        shrinks once the padded data spans less than ``VIEW_SHRINK_FRACTION`` of it.
+
+        Args:
+            line_name (str): Name of the line that received new data.
+            bounds (tuple[float, float, float, float] | None): ``(xmin, xmax, ymin,
+                ymax)`` of the new finite data, or None if there is none.
+            replace (bool): The data replaces the previous data of the line instead
+                of extending it (default: False).
+        """
+        subplot_name = self._line_axes[line_name]
+        if replace:
+            if bounds is None:
+                self._line_bounds.pop(line_name, None)
+            else:
+                self._line_bounds[line_name] = bounds
+            union = self._merge_bounds(
+                self._line_bounds.get(name)
+                for name, subplot in self._line_axes.items()
+                if subplot == subplot_name
+            )
+        elif bounds is None:
+            return
+        else:
+            self._line_bounds[line_name] = self._merge_bounds(
+                (self._line_bounds.get(line_name), bounds)
+            )
+            union = self._merge_bounds((self._data_bounds.get(subplot_name), bounds))
+
+        if union is None:
+            # no data left to fit, keep the current view
+            self._data_bounds.pop(subplot_name, None)
+            return
+        self._data_bounds[subplot_name] = union
+        xmin, xmax, ymin, ymax = union
+
+        view = self._view_limits.get(subplot_name)
+        fits = (
+            view is not None
+            and view[0] <= xmin
+            and xmax <= view[1]
+            and view[2] <= ymin
+            and ymax <= view[3]
+        )
+        if fits and not replace:
+            return
+
+        ax = self.axes[subplot_name]
+        xmargin, ymargin = ax.margins()
+        xlim = self._padded_limits(ax.xaxis, xmin, xmax, xmargin)
+        ylim = self._padded_limits(ax.yaxis, ymin, ymax, ymargin)
+        if (
+            fits
+            and xlim[1] - xlim[0] >= VIEW_SHRINK_FRACTION * (view[1] - view[0])
+            and ylim[1] - ylim[0] >= VIEW_SHRINK_FRACTION * (view[3] - view[2])
+        ):
+            return
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+        self._view_limits[subplot_name] = (*xlim, *ylim)
+
+    @staticmethod
+    def _finite_bounds(
+        x_data: np.ndarray, y_data: np.ndarray
+    ) -> tuple[float, float, float, float] | None:
+        """Return ``(xmin, xmax, ymin, ymax)`` of the finite samples, or None if there are none."""
+        if not x_data.size:
+            return None
+        bounds = (x_data.min(), x_data.max(), y_data.min(), y_data.max())
+        if np.isfinite(bounds).all():
+            return bounds
+        # NaN (e.g. an empty average bin) or inf, bound the remaining samples only
+        finite = np.isfinite(x_data) & np.isfinite(y_data)
+        if not finite.any():
+            return None
+        x_data, y_data = x_data[finite], y_data[finite]
+        return (x_data.min(), x_data.max(), y_data.min(), y_data.max())
+
+    @staticmethod
+    def _merge_bounds(bounds) -> tuple[float, float, float, float] | None:
+        """Return the union of ``(xmin, xmax, ymin, ymax)`` bounds, skipping None entries."""
+        bounds = [b for b in bounds if b is not None]
+        if not bounds:
+            return None
+        xmins, xmaxs, ymins, ymaxs = zip(*bounds)
+        return (min(xmins), max(xmaxs), min(ymins), max(ymaxs))
+
+    @staticmethod
+    def _padded_limits(
+        axis: Any, vmin: float, vmax: float, margin: float
+    ) -> tuple[float, float]:
+        """Pad data bounds by a fraction of their span, as ``autoscale_view`` does."""
+        pad = margin * (vmax - vmin)
+        lo, hi = axis.get_major_locator().nonsingular(vmin - pad, vmax + pad)
+        return float(lo), float(hi)
+
+    @contextmanager
+    def batching(self):
+        """Defer redraws until the end of the block.
+
+        Updates made inside the block are drawn together with a single redraw when
+        the outermost ``batching`` block exits. Blocks may be nested.
+
+        Example:
+            >>> with plotter.batching():
+            ...     plotter.update_line("I", t, I)
+            ...     plotter.update_line("Q", t, Q)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Redraw the lines and process pending GUI events, unless inside a batch.
+
+        Blits the lines over the cached subplot backgrounds when possible, and falls
+        back to a full redraw when the backgrounds are stale or the backend cannot blit.
+        Non-interactive backends only receive the new data, and render when saved.
+        """
+        if self.fig is None or self._batch_depth > 0:
+            return
+        self._flush_pending()
+        if not self._interactive:
+            return
+        canvas = self.fig.canvas
+        if not canvas.supports_blit:
+            canvas.draw_idle()
+        elif self._needs_full_draw:
+            canvas.draw()  # recaptures the backgrounds via _on_draw
+        else:
+            for name, ax in self.axes.items():
+                canvas.restore_region(self._backgrounds[name])
+            for line_name, line in self.lines.items():
+                self.axes[self._line_axes[line_name]].draw_artist(line)
+            for ax in self.axes.values():
+                canvas.blit(ax.bbox)
+        canvas.flush_events()
+
+    def show(self, block: bool = False) -> None:
+        """Show the figure window.
+
+        Args:
+            block (bool): Block until the window is closed (default: False).
+        """
+        self._ensure_figure()
+        import matplotlib.pyplot as plt
+
+        plt.show(block=block)
+
+    def save_figure(self, filepath: str | Path, dpi: int = 300) -> None:
+        """Save the figure to an image file.
+
+        Args:
+            filepath (str | Path): Destination path; the format follows the suffix.
+            dpi (int): Resolution in dots per inch (default: 300).
+        """
+        fig = self._ensure_figure()
+        self._flush_pending()
+        # animated artists are skipped by savefig, so render the lines as static
+        for line in self.lines.values():
+            line.set_animated(False)
+        try:
+            fig.savefig(filepath, dpi=dpi, bbox_inches="tight")
+        finally:
+            for line in self.lines.values():
+                line.set_animated(True)
+            self._invalidate_backgrounds()
+
+    def clear(self) -> None:
+        """Remove all subplots and lines, keeping the figure (and its window) open.
+
+        The figure can then be reused, for example for the next experiment, without
+        the cost of creating a new one.
+        """
+        if self.fig is not None:
+            self._remove_subplots()
+        self._reset_state()
+        self._refresh()
+
+    def close(self) -> None:
+        """Close the figure and forget all subplots and lines."""
+        if self.fig is not None and self._interactive:
+            import matplotlib.pyplot as plt
+
+            plt.close(self.fig)
+        self.fig = None
+        self._reset_state()
+
+    def _remove_subplots(self) -> None:
+        """Remove the subplots from the figure."""
+        for ax in self.axes.values():
+            ax.remove()
+
+    def _reset_state(self) -> None:
+        """Forget all subplots, lines and cached drawing state."""
+        self.axes.clear()
+        self.lines.clear()
+        self._line_axes.clear()
+        self._buffers.clear()
+        self._pending.clear()
+        self._backgrounds.clear()
+        self._view_limits.clear()
+        self._line_bounds.clear()
+        self._data_bounds.clear()
+        self._needs_full_draw = True
@@ -0,0 +1,153 @@
+"""
+Point Buffer Module.
+
+This module provides the preallocated storage behind the lines of
+:class:`~qeg_nmr_qua.plotting.live_plotter.LivePlotter`, so samples streamed
+during an acquisition are written in place instead of reallocating the line data.
+"""
+
+import numpy as np
+
+# double precision keeps large x values (e.g. timestamps) distinct
+BUFFER_DTYPE = np.float64
+
+
+class PointBuffer:
+    """Preallocated x/y storage for the points of one line.
+
+    The x and y values are kept in two separate arrays, so the visible points of
+    each coordinate are a contiguous view that can be handed to a plotting library
+    without copying.
+
+    - Without ``max_points``, the buffer doubles its capacity when full.
+    - With ``max_points``, the buffer is a ring holding the most recent
+      ``max_points`` samples. Each sample is written twice (at ``i`` and
+      ``i + max_points``), so the visible window is always a contiguous,
+      chronologically ordered view of the arrays.
+
+    Attributes:
+        x (np.ndarray): Storage for the x values.
+        y (np.ndarray): Storage for the y values.
+        n (int): Number of samples written since the buffer was last loaded or cleared.
+        cap (int): Number of samples the buffer holds before growing or wrapping.
+        max_points (int | None): Size of the ring, or None for an unbounded buffer.
+        dtype (np.dtype): Data type of the stored values.
+
+    Example:
+        >>> buf = PointBuffer(capacity=4, max_points=2)
+        >>> for i in range(3):
+        ...     buf.append(i, 10 * i)
+        >>> buf.view()
+        (array([1., 2.]), array([10., 20.]))
+    """
+
+    __slots__ = ("x", "y", "n", "cap", "max_points", "dtype")
+
+    def __init__(
+        self, capacity: int, max_points: int | None = None, dtype: type = BUFFER_DTYPE
+    ):
+        """Allocate an empty buffer.
+
+        Args:
+            capacity (int): Initial number of samples of an unbounded buffer. Ignored
+                when ``max_points`` is given.
+            max_points (int | None): Keep only the most recent ``max_points`` samples.
+                None keeps the full history.
+            dtype (type): Data type of the stored values (default: ``float64``).
+        """
+        self.max_points = max_points
+        self.dtype = np.dtype(dtype)
+        self.cap = max_points or capacity
+        # a bounded ring mirrors every sample
+        size = 2 * self.cap if max_points else self.cap
+        self.x = np.empty(size, dtype=self.dtype)
+        self.y = np.empty(size, dtype=self.dtype)
+        self.n = 0
+
+    def append(self, x: float, y: float) -> None:
+        """Write one sample, growing or wrapping the buffer as needed."""
+        n, cap = self.n, self.cap
+        if self.max_points is None:
+            if n == cap:
+                self._grow(2 * cap)
+            self.x[n] = x
+            self.y[n] = y
+        else:
+            idx = n % cap
+            self.x[idx] = self.x[idx + cap] = x
+            self.y[idx] = self.y[idx + cap] = y
+        self.n = n + 1
+
+    def extend(self, x_data: np.ndarray, y_data: np.ndarray) -> None:
+        """Write a block of samples, as if each had been appended in turn.
+
+        Args:
+            x_data (np.ndarray): X values of the new samples.
+            y_data (np.ndarray): Y values of the new samples, same length as ``x_data``.
+        """
+        k = len(x_data)
+        n, cap = self.n, self.cap
+        if self.max_points is None:
+            if n + k > cap:
+                self._grow(1 << (n + k - 1).bit_length())
+            self.x[n : n + k] = x_data
+            self.y[n : n + k] = y_data
+        else:
+            # only the last ``cap`` samples can remain visible
+            m = min(k, cap)
+            idx = np.arange(n + k - m, n + k) % cap
+            self.x[idx] = self.x[idx + cap] = x_data[k - m :]
+            self.y[idx] = self.y[idx + cap] = y_data[k - m :]
+        self.n = n + k
+
+    def load(self, x_data: np.ndarray, y_data: np.ndarray) -> None:
+        """Overwrite the buffer with the given data.
+
+        Args:
+            x_data (np.ndarray): New x values, at most ``max_points`` long for a ring.
+            y_data (np.ndarray): New y values, same length as ``x_data``.
+        """
+        n = len(x_data)
+        if self.max_points is None:
+            if n > self.cap:
+                self.n = 0
+                self._grow(1 << (n - 1).bit_length())
+            self.x[:n] = x_data
+            self.y[:n] = y_data
+        else:
+            # lay the data out as if it had been appended to an empty ring
+            cap = self.cap
+            self.x[:n] = self.x[cap : cap + n] = x_data
+            self.y[:n] = self.y[cap : cap + n] = y_data
+        self.n = n
+
+    def clear(self) -> None:
+        """Forget all samples, keeping the allocated storage."""
+        self.n = 0
+
+    def next_evicted(self) -> tuple[float, float] | None:
+        """Return the sample the next append overwrites, or None if nothing is evicted."""
+        n, cap = self.n, self.cap
+        if self.max_points is None or n < cap:
+            return None
+        idx = n % cap
+        return self.x[idx], self.y[idx]
+
+    def view(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the visible samples as ``(x, y)`` views, oldest first."""
+        n, cap = self.n, self.cap
+        if self.max_points is None:
+            start, stop = 0, n
+        else:
+            start = n % cap if n >= cap else 0
+            stop = start + min(n, cap)
+        return self.x[start:stop], self.y[start:stop]
+
+    def _grow(self, cap: int) -> None:
+        """Reallocate an unbounded buffer to ``cap`` samples, keeping its data."""
+        n = self.n
+        for name in ("x", "y"):
+            grown = np.empty(cap, dtype=self.dtype)
+            grown[:n] = getattr(self, name)[:n]
+            setattr(self, name, grown)
+        self.cap = cap
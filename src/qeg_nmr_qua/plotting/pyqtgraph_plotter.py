@@ -0,0 +1,242 @@
+"""
+PyQtGraph Live Plotting Module.
+
+This module provides a pyqtgraph backend for :class:`LivePlotter`, for acquisitions
+that stream data faster than matplotlib can redraw it. pyqtgraph and a Qt binding
+are optional dependencies, installed with ``pip install qeg-nmr-qua[pyqtgraph]``.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
+
+from qeg_nmr_qua.plotting.live_plotter import LivePlotter
+
+try:
+    import pyqtgraph as pg
+except ImportError:  # optional dependency
+    pg = None
+
+
+class PyQtGraphLivePlotter(LivePlotter):
+    """Live plotter that renders with pyqtgraph instead of matplotlib.
+
+    Has the same interface as :class:`LivePlotter`, including the preallocated point
+    buffers and :meth:`batching`, but draws into a Qt window. pyqtgraph repaints a
+    line directly from ``setData`` without re-rendering the axes, which keeps up with
+    update rates at which matplotlib's redraws dominate the acquisition loop.
+
+    **Differences from LivePlotter:**
+
+    - Subplots always autorange to their data; the ``autoscale`` arguments are ignored.
+    - Colors accept any matplotlib color specification, and default to the
+      matplotlib color cycle.
+    - :meth:`save_figure` renders the current data through matplotlib, so saved
+      figures look the same regardless of the live backend.
+
+    Attributes:
+        title (str): Title of the plot window and saved figures.
+        figsize (tuple[float, float]): Figure size in inches.
+        fig (pyqtgraph.GraphicsLayoutWidget | None): The plot window, created with
+            the first subplot.
+        axes (dict[str, pyqtgraph.PlotItem]): Subplots by name.
+        lines (dict[str, pyqtgraph.PlotDataItem]): Lines by name.
+
+    Example:
+        >>> plotter = PyQtGraphLivePlotter(title="FID")
+        >>> plotter.create_subplot("fid", xlabel="Time (µs)", ylabel="Signal (µV)")
+        >>> plotter.add_line("fid", "I", color="tab:blue", label="I")
+        >>> plotter.show()
+        >>> for t, v in stream:
+        ...     plotter.append_point("I", t, v)
+        >>> plotter.save_figure("fid.png")
+        >>> plotter.close()
+    """
+
+    # pixels per inch used to size the window from figsize
+    WINDOW_DPI = 100
+
+    def __init__(self, title: str = "Live Plot", figsize: tuple[float, float] = (10, 6)):
+        """Initialize the plotter. The window is created lazily with the first subplot.
+
+        Args:
+            title (str): Title of the plot window (default: "Live Plot").
+            figsize (tuple[float, float]): Figure size in inches (default: (10, 6)).
+
+        Raises:
+            ImportError: If pyqtgraph is not installed.
+        """
+        if pg is None:
+            raise ImportError(
+                "PyQtGraphLivePlotter requires pyqtgraph and a Qt binding, "
+                "install them with `pip install qeg-nmr-qua[pyqtgraph]`."
+            )
+        super().__init__(title=title, figsize=figsize)
+        self._app = None
+        # subplot name -> (xlabel, ylabel, title), line name -> (color, label)
+        self._subplot_labels: dict[str, tuple[str, str, str]] = {}
+        self._line_styles: dict[str, tuple[str, str | None]] = {}
+
+    def _ensure_figure(self):
+        """Create the Qt application and plot window on first use and return the window."""
+        if self.fig is None:
+            self._app = pg.mkQApp()
+            self.fig = pg.GraphicsLayoutWidget(title=self.title)
+            width, height = self.figsize
+            self.fig.resize(int(width * self.WINDOW_DPI), int(height * self.WINDOW_DPI))
+        return self.fig
+
+    def create_subplot(
+        self, name: str, xlabel: str = "", ylabel: str = "", title: str = ""
+    ) -> None:
+        """Add a subplot below the existing ones.
+
+        Args:
+            name (str): Unique name used to refer to the subplot.
+            xlabel (str): X-axis label.
+            ylabel (str): Y-axis label.
+            title (str): Subplot title.
+
+        Raises:
+            ValueError: If a subplot with this name already exists.
+        """
+        if name in self.axes:
+            raise ValueError(f"Subplot '{name}' already exists.")
+        window = self._ensure_figure()
+
+        ax = window.addPlot(row=len(self.axes), col=0, title=title or None)
+        ax.setLabel("bottom", xlabel)
+        ax.setLabel("left", ylabel)
+        ax.showGrid(x=True, y=True)
+        self.axes[name] = ax
+        self._subplot_labels[name] = (xlabel, ylabel, title)
+
+    def add_line(
+        self,
+        subplot_name: str,
+        line_name: str,
+        color: str | None = None,
+        label: str | None = None,
+        max_points: int | None = None,
+        capacity: int | None = None,
+    ) -> None:
+        """Add an empty line to a subplot.
+
+        Args:
+            subplot_name (str): Name of the subplot the line is drawn on.
+            line_name (str): Unique name used to refer to the line.
+            color (str | None): Matplotlib color, or None for the next cycle color.
+            label (str | None): Legend label. A legend is shown if given.
+            max_points (int | None): Keep only the most recent ``max_points`` samples.
+                None keeps the full history.
+            capacity (int | None): Number of points to preallocate for a line without
+                ``max_points``. None uses the LivePlotter default.
+
+        Raises:
+            ValueError: If the subplot does not exist, the line name is taken,
+                or ``max_points`` or ``capacity`` is not positive.
+        """
+        self._validate_new_line(subplot_name, line_name, max_points, capacity)
+
+        ax = self.axes[subplot_name]
+        if color is None:
+            n_lines = list(self._line_axes.values()).count(subplot_name)
+            color = f"C{n_lines}"
+        color = to_hex(color)
+        if label is not None and ax.legend is None:
+            ax.addLegend()
+        item = ax.plot([], [], pen=pg.mkPen(color), name=label)
+
+        self._line_styles[line_name] = (color, label)
+        self._register_line(subplot_name, line_name, item, max_points, capacity)
+
+    @staticmethod
+    def _set_line_data(line: Any, x_data: np.ndarray, y_data: np.ndarray) -> None:
+        """Hand new data to a line item, which schedules its own repaint."""
+        line.setData(x_data, y_data)
+
+    def _autoscale(
+        self,
+        line_name: str,
+        bounds: tuple[float, float, float, float] | None,
+        replace: bool = False,
+    ) -> None:
+        """Do nothing, pyqtgraph autoranges each subplot when its data changes.
+
+        Its autorange skips non-finite values and follows replaced or cleared data
+        down as well as up, so no bounds are tracked here.
+        """
+
+    def _refresh(self) -> None:
+        """Process pending Qt events so the window repaints, unless inside a batch."""
+        if self.fig is None or self._batch_depth > 0:
+            return
+        self._flush_pending()
+        self._app.processEvents()
+
+    def show(self, block: bool = False) -> None:
+        """Show the plot window.
+
+        Args:
+            block (bool): Run the Qt event loop until the window is closed (default: False).
+        """
+        window = self._ensure_figure()
+        window.show()
+        if block:
+            pg.exec()
+        else:
+            self._app.processEvents()
+
+    def save_figure(self, filepath: str | Path, dpi: int = 300) -> None:
+        """Save the current data to an image file, rendered with matplotlib.
+
+        Args:
+            filepath (str | Path): Destination path; the format follows the suffix.
+            dpi (int): Resolution in dots per inch (default: 300).
+        """
+        self._flush_pending()
+        fig = Figure(figsize=self.figsize)
+        fig.suptitle(self.title)
+        mpl_axes = {}
+        for row, (name, (xlabel, ylabel, title)) in enumerate(self._subplot_labels.items()):
+            ax = fig.add_subplot(len(self._subplot_labels), 1, row + 1)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            ax.grid(True)
+            mpl_axes[name] = ax
+
+        legend_axes = set()
+        for line_name, item in self.lines.items():
+            x_data, y_data = item.getData()
+            if x_data is None:
+                x_data, y_data = [], []
+            color, label = self._line_styles[line_name]
+            subplot_name = self._line_axes[line_name]
+            mpl_axes[subplot_name].plot(x_data, y_data, color=color, label=label)
+            if label is not None:
+                legend_axes.add(subplot_name)
+        for name in legend_axes:
+            mpl_axes[name].legend()
+
+        fig.savefig(filepath, dpi=dpi, bbox_inches="tight")
+
+    def close(self) -> None:
+        """Close the window and forget all subplots and lines."""
+        if self.fig is not None:
+            self.fig.close()
+            self.fig = None
+        super().close()
+
+    def _remove_subplots(self) -> None:
+        """Remove the subplots from the window."""
+        self.fig.clear()
+
+    def _reset_state(self) -> None:
+        """Forget all subplots, lines and their styles."""
+        super()._reset_state()
+        self._subplot_labels.clear()
+        self._line_styles.clear()
@@ -0,0 +1,25 @@
+"""Shared fixtures for the qeg_nmr_qua tests."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sine_wave():
+    """One period of a sine sampled at 50 points, read-only and shared by all tests."""
+    x = np.linspace(0, 2 * np.pi, 50)
+    y = np.sin(x)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+@pytest.fixture(scope="session")
+def agg_backend():
+    """Select matplotlib's non-interactive Agg backend, once per test process.
+
+    Only tests that plot request it, so other test selections never import matplotlib.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
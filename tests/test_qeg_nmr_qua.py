@@ -1,44 +1,18 @@
 """Tests for the qeg_nmr_qua package (updated for the refactor).
 
-These tests exercise the new `OPXConfig` API and the DataSaver/LivePlotter
-behaviour. They are intentionally small and focus on surface behaviour rather
-than exhaustive validation of every helper class.
+These tests exercise the new `OPXConfig` API and the LivePlotter behaviour;
+DataSaver is covered by `test_data_saver.py`. They are intentionally small and
+focus on surface behaviour rather than exhaustive validation of every helper
+class.
 """
 
-import json
-import tempfile
-from pathlib import Path
-
-import matplotlib
-
-# Set non-interactive backend early to avoid GUI issues when LivePlotter imports matplotlib
-matplotlib.use("Agg")
-
-import numpy as np
-import pytest
-
-from qeg_nmr_qua import DataSaver, LivePlotter, OPXConfig, __version__
-
-"""Tests for the qeg_nmr_qua package (updated for the refactor).
-
-These tests exercise the new `OPXConfig` API and the DataSaver/LivePlotter
-behaviour. They are intentionally small and focus on surface behaviour rather
-than exhaustive validation of every helper class.
-"""
-
-import json
-import tempfile
-from pathlib import Path
-
-import matplotlib
-
-# Set non-interactive backend early to avoid GUI issues when LivePlotter imports matplotlib
-matplotlib.use("Agg")
+import subprocess
+import sys
 
 import numpy as np
 import pytest
 
-from qeg_nmr_qua import DataSaver, LivePlotter, OPXConfig, __version__
+from qeg_nmr_qua import LivePlotter, OPXConfig
 from qeg_nmr_qua.config.element import Element
 
 
@@ -80,207 +54,302 @@ class TestOPXConfig:
         assert "w1" in cfg["integration_weights"]
 
 
-class TestDataSaver:
-    def test_init_creates_directory(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_path = Path(tmpdir) / "test_data"
-            saver = DataSaver(base_path=data_path)
-            assert data_path.exists()
-            assert saver.experiment_name == "nmr_experiment"
+@pytest.mark.usefixtures("agg_backend")
+class TestLivePlotter:
+    """Tests for LivePlotter class."""
+
+    @pytest.fixture(scope="class")
+    def shared_plotter(self):
+        """Create one plotter, and so one figure, shared by the tests of this class."""
+        plotter = LivePlotter()
+        yield plotter
+        plotter.close()
+
+    @pytest.fixture
+    def plotter(self, shared_plotter):
+        """Give each test the shared plotter, cleared of its subplots afterwards."""
+        yield shared_plotter
+        shared_plotter.clear()
 
-    def test_save_and_load_hdf5_roundtrip(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            saver = DataSaver(base_path=tmpdir)
+    def test_init(self) -> None:
+        """Test LivePlotter initialization."""
+        plotter = LivePlotter(title="Test Plot", figsize=(8, 5))
+        assert plotter.title == "Test Plot"
+        assert plotter.figsize == (8, 5)
+        plotter.close()
 
-            original_data = {
-                "x": np.array([1.0, 2.0, 3.0]),
-                "y": np.array([4.0, 5.0, 6.0]),
-            }
-            original_metadata = {"test_key": "test_value"}
+    def test_create_subplot(self, plotter) -> None:
+        """Test creating a subplot."""
+        plotter.create_subplot(
+            name="main",
+            xlabel="Time (s)",
+            ylabel="Signal (V)",
+            title="Signal vs Time",
+        )
 
-            filepath = saver.save_hdf5(
-                original_data, original_metadata, filename="test_file"
-            )
+        assert "main" in plotter.axes
+        assert plotter.fig is not None
 
-            loaded_data, loaded_metadata = saver.load_hdf5(filepath)
+    def test_add_and_update_line(self, plotter, sine_wave) -> None:
+        """Test adding and updating a line."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "signal", color="red", label="Signal")
 
-            np.testing.assert_array_equal(loaded_data["x"], original_data["x"])
-            np.testing.assert_array_equal(loaded_data["y"], original_data["y"])
-            assert loaded_metadata["test_key"] == "test_value"
+        assert "signal" in plotter.lines
 
-    def test_save_json(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            saver = DataSaver(base_path=tmpdir)
-            config_data = {"param1": 100, "param2": "test", "param3": [1, 2, 3]}
-            filepath = saver.save_json(config_data, filename="test_config")
-            assert filepath.exists()
-            with open(filepath) as f:
-                loaded = json.load(f)
-            assert loaded == config_data
+        x_data, y_data = sine_wave
+        plotter.update_line("signal", x_data, y_data)
 
+        line = plotter.lines["signal"]
+        assert np.array_equal(line.get_xdata(), x_data)
+        assert np.array_equal(line.get_ydata(), y_data)
 
-class TestLivePlotter:
-    def test_basic_plot_lifecycle(self) -> None:
-        plotter = LivePlotter(title="Test Plot", figsize=(6, 4))
+    def test_append_point(self, plotter) -> None:
+        """Test appending points to a line."""
         plotter.create_subplot("main")
         plotter.add_line("main", "data")
 
-        x = np.linspace(0, 2 * np.pi, 50)
-        y = np.sin(x)
-        plotter.update_line("data", x, y)
+        plotter.append_point("data", 0.0, 1.0)
+        plotter.append_point("data", 1.0, 2.0)
+        plotter.append_point("data", 2.0, 3.0)
 
         line = plotter.lines["data"]
-        np.testing.assert_array_equal(line.get_xdata(), x)
-        np.testing.assert_array_equal(line.get_ydata(), y)
+        assert np.array_equal(line.get_xdata(), [0.0, 1.0, 2.0])
+        assert np.array_equal(line.get_ydata(), [1.0, 2.0, 3.0])
 
-        # save figure
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "fig.png"
-            plotter.save_figure(str(filepath))
-            assert filepath.exists()
+    def test_append_point_grows_past_capacity(self, plotter, monkeypatch) -> None:
+        """Test that an unbounded line keeps every appended point."""
+        from qeg_nmr_qua.plotting import live_plotter
 
-        plotter.close()
+        monkeypatch.setattr(live_plotter, "DEFAULT_BUFFER_CAPACITY", 4)
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
 
+        n_points = 10  # more than the initial buffer capacity
+        for i in range(n_points):
+            plotter.append_point("data", float(i), float(2 * i))
 
-class TestPackageImport:
-    def test_version(self) -> None:
-        assert __version__ == "0.1.0"
-
-    def test_exports_present(self) -> None:
-        import qeg_nmr_qua as qnmr
+        line = plotter.lines["data"]
+        assert np.array_equal(line.get_xdata(), np.arange(n_points))
+        assert np.array_equal(line.get_ydata(), 2 * np.arange(n_points))
 
-        assert hasattr(qnmr, "OPXConfig")
-        assert hasattr(qnmr, "DataSaver")
-        assert hasattr(qnmr, "LivePlotter")
+    def test_add_line_capacity(self, plotter) -> None:
+        """Test that a line preallocates the requested capacity and still grows past it."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data", capacity=2)
+        assert plotter._buffers["data"].cap == 2
 
+        for i in range(5):
+            plotter.append_point("data", float(i), float(i))
+        assert np.array_equal(plotter.lines["data"].get_xdata(), np.arange(5))
 
-class TestDataSaver:
-    """Tests for DataSaver class."""
+        with pytest.raises(ValueError, match="capacity"):
+            plotter.add_line("main", "empty", capacity=0)
 
-    def test_init_creates_directory(self) -> None:
-        """Test that initialization creates the data directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_path = Path(tmpdir) / "test_data"
-            saver = DataSaver(base_path=data_path)
-            assert data_path.exists()
-            assert saver.experiment_name == "nmr_experiment"
+    def test_append_point_max_points(self, plotter) -> None:
+        """Test that a bounded line keeps only the most recent points, in order."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data", max_points=4)
 
-    def test_save_hdf5(self) -> None:
-        """Test saving data to HDF5 format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            saver = DataSaver(base_path=tmpdir, experiment_name="test_exp")
+        plotter.update_line("data", np.array([0.0, 1.0]), np.array([0.0, 10.0]))
+        for i in range(2, 7):
+            plotter.append_point("data", float(i), float(10 * i))
 
-            data = {
-                "time": np.linspace(0, 1, 100),
-                "signal": np.sin(np.linspace(0, 2 * np.pi, 100)),
-            }
-            metadata = {"sample_rate": 1000, "experiment_type": "FID"}
+        line = plotter.lines["data"]
+        assert np.array_equal(line.get_xdata(), [3.0, 4.0, 5.0, 6.0])
+        assert np.array_equal(line.get_ydata(), [30.0, 40.0, 50.0, 60.0])
 
-            filepath = saver.save_hdf5(data, metadata)
+    def test_append_point_keeps_large_x_distinct(self, plotter) -> None:
+        """Test that buffered x values keep double precision."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
 
-            assert filepath.exists()
-            assert filepath.suffix == ".h5"
+        x = 1e8 + np.arange(3.0)
+        for xi in x:
+            plotter.append_point("data", xi, 0.0)
 
-    def test_save_and_load_hdf5(self) -> None:
-        """Test saving and loading HDF5 data round-trip."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            saver = DataSaver(base_path=tmpdir)
+        assert np.array_equal(plotter.lines["data"].get_xdata(), x)
 
-            original_data = {
-                "x": np.array([1.0, 2.0, 3.0]),
-                "y": np.array([4.0, 5.0, 6.0]),
-            }
-            original_metadata = {"test_key": "test_value"}
+    @pytest.mark.parametrize("max_points", [None, 4])
+    def test_extend_points_matches_append_point(self, plotter, max_points) -> None:
+        """Test that extending a line by blocks gives the same points as appending."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "appended", max_points=max_points, capacity=2)
+        plotter.add_line("main", "extended", max_points=max_points, capacity=2)
 
-            filepath = saver.save_hdf5(
-                original_data, original_metadata, filename="test_file"
-            )
+        x = np.arange(11, dtype=float)
+        for xi in x:
+            plotter.append_point("appended", xi, -xi)
+        for block in (x[:1], x[1:3], x[3:3], x[3:9], x[9:]):
+            plotter.extend_points("extended", block, -block)
 
-            loaded_data, loaded_metadata = saver.load_hdf5(filepath)
+        appended, extended = plotter.lines["appended"], plotter.lines["extended"]
+        assert np.array_equal(extended.get_xdata(), appended.get_xdata())
+        assert np.array_equal(extended.get_ydata(), appended.get_ydata())
 
-            np.testing.assert_array_equal(loaded_data["x"], original_data["x"])
-            np.testing.assert_array_equal(loaded_data["y"], original_data["y"])
-            assert loaded_metadata["test_key"] == "test_value"
+    def test_update_lines_redraws_once(self, plotter, monkeypatch, sine_wave) -> None:
+        """Test that a batched multi-line update triggers a single redraw."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "I")
+        plotter.add_line("main", "Q")
+        # render as if a window were shown
+        monkeypatch.setattr(plotter, "_interactive", True)
 
-    def test_save_json(self) -> None:
-        """Test saving configuration to JSON format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            saver = DataSaver(base_path=tmpdir)
+        refreshes = []
+        monkeypatch.setattr(plotter.fig.canvas, "flush_events", lambda: refreshes.append(1))
 
-            config_data = {"param1": 100, "param2": "test", "param3": [1, 2, 3]}
+        x, y = sine_wave
+        plotter.update_lines({"I": (x, y), "Q": (x, 0.5 * y)})
 
-            filepath = saver.save_json(config_data, filename="test_config")
+        assert len(refreshes) == 1
+        assert np.array_equal(plotter.lines["I"].get_ydata(), y)
+        assert np.array_equal(plotter.lines["Q"].get_ydata(), 0.5 * y)
 
-            assert filepath.exists()
-            assert filepath.suffix == ".json"
+    def test_batched_appends_set_line_data_once(self, plotter) -> None:
+        """Test that appended points are handed to the line once per redraw."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
 
-            with open(filepath) as f:
-                loaded = json.load(f)
+        line = plotter.lines["data"]
+        set_data = line.set_data
+        calls = []
+        line.set_data = lambda *args: (calls.append(1), set_data(*args))
 
-            assert loaded == config_data
+        with plotter.batching():
+            for i in range(5):
+                plotter.append_point("data", float(i), float(i), autoscale=False)
 
+        assert len(calls) == 1
+        assert np.array_equal(line.get_xdata(), [0.0, 1.0, 2.0, 3.0, 4.0])
 
-class TestLivePlotter:
-    """Tests for LivePlotter class."""
+    def test_refresh_blits_when_limits_unchanged(self, plotter, monkeypatch, sine_wave) -> None:
+        """Test that redraws within unchanged limits blit instead of redrawing the figure."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
+        # render as if a window were shown
+        monkeypatch.setattr(plotter, "_interactive", True)
 
-    def test_init(self) -> None:
-        """Test LivePlotter initialization."""
-        plotter = LivePlotter(title="Test Plot", figsize=(8, 5))
-        assert plotter.title == "Test Plot"
-        assert plotter.figsize == (8, 5)
-        plotter.close()
+        x, y = sine_wave
+        plotter.update_line("data", x, y)
 
-    def test_create_subplot(self) -> None:
-        """Test creating a subplot."""
-        plotter = LivePlotter()
-        plotter.create_subplot(
-            name="main",
-            xlabel="Time (s)",
-            ylabel="Signal (V)",
-            title="Signal vs Time",
-        )
+        full_draws = []
+        monkeypatch.setattr(plotter.fig.canvas, "draw", lambda: full_draws.append(1))
+        plotter.update_line("data", x, 0.5 * y, autoscale=False)
 
-        assert "main" in plotter.axes
-        assert plotter.fig is not None
-        plotter.close()
+        assert full_draws == []
+        assert np.array_equal(plotter.lines["data"].get_ydata(), 0.5 * y)
 
-    def test_add_and_update_line(self) -> None:
-        """Test adding and updating a line."""
-        plotter = LivePlotter()
+    def test_headless_refresh_skips_rendering(self, plotter, monkeypatch, sine_wave) -> None:
+        """Test that updates on a non-interactive backend are not rendered until saved."""
         plotter.create_subplot("main")
-        plotter.add_line("main", "signal", color="red", label="Signal")
+        plotter.add_line("main", "data")
+        assert not plotter._interactive  # the tests run on Agg
 
-        assert "signal" in plotter.lines
+        canvas = plotter.fig.canvas
+        renders = []
+        monkeypatch.setattr(canvas, "draw", lambda: renders.append("draw"))
+        monkeypatch.setattr(canvas, "restore_region", lambda region: renders.append("blit"))
 
-        x_data = np.linspace(0, 1, 50)
-        y_data = np.sin(2 * np.pi * x_data)
-        plotter.update_line("signal", x_data, y_data)
+        plotter.update_line("data", *sine_wave)
+        plotter.append_point("data", 7.0, 0.0)
 
-        line = plotter.lines["signal"]
-        np.testing.assert_array_equal(line.get_xdata(), x_data)
-        np.testing.assert_array_equal(line.get_ydata(), y_data)
+        assert renders == []
+        assert plotter.lines["data"].get_xdata()[-1] == 7.0
 
-        plotter.close()
+    def test_headless_figure_bypasses_pyplot(self) -> None:
+        """Test that figures on a non-interactive backend are not registered with pyplot."""
+        import matplotlib.pyplot as plt
 
-    def test_append_point(self) -> None:
-        """Test appending points to a line."""
+        open_figures = plt.get_fignums()
         plotter = LivePlotter()
         plotter.create_subplot("main")
+        assert plt.get_fignums() == open_figures
+        plotter.close()
+
+    def test_autoscale_skipped_inside_view(self, plotter) -> None:
+        """Test that points inside the current view do not trigger a rescale."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
+        plotter.update_line("data", np.array([0.0, 10.0]), np.array([0.0, 10.0]))
+
+        ax = plotter.axes["main"]
+        relims = []
+        ax.relim = lambda: relims.append(1)
+        set_xlim = ax.set_xlim
+        rescales = []
+        ax.set_xlim = lambda *args: (rescales.append(1), set_xlim(*args))
+
+        plotter.append_point("data", 5.0, 5.0)
+        assert rescales == []
+
+        plotter.append_point("data", 20.0, 5.0)
+        assert rescales == [1]
+        assert ax.get_xlim()[0] < 0.0 and ax.get_xlim()[1] > 20.0
+        # the rescale uses the running data bounds, not the stored lines
+        assert relims == []
+
+    def test_autoscale_ignores_non_finite_values(self, plotter) -> None:
+        """Test that NaN samples do not collapse the view or poison later rescales."""
+        plotter.create_subplot("main")
         plotter.add_line("main", "data")
 
-        plotter.append_point("data", 0.0, 1.0)
-        plotter.append_point("data", 1.0, 2.0)
-        plotter.append_point("data", 2.0, 3.0)
+        plotter.update_line("data", np.arange(4.0), np.array([np.nan, 10.0, 20.0, 30.0]))
+        ylim = plotter.axes["main"].get_ylim()
+        assert ylim[0] < 10.0 and ylim[1] > 30.0
 
-        line = plotter.lines["data"]
-        np.testing.assert_array_equal(line.get_xdata(), [0.0, 1.0, 2.0])
-        np.testing.assert_array_equal(line.get_ydata(), [1.0, 2.0, 3.0])
+        plotter.append_point("data", 4.0, np.nan)
+        plotter.append_point("data", 5.0, 40.0)
+        assert plotter.axes["main"].get_ylim()[1] > 40.0
 
-        plotter.close()
+    def test_autoscale_shrinks_to_replaced_data(self, plotter) -> None:
+        """Test that the view follows a trace that decays across replacements."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
+        x = np.arange(10.0)
+
+        plotter.update_line("data", x, np.full(10, 1000.0) * np.linspace(-1, 1, 10))
+        plotter.update_line("data", x, np.full(10, 1e-3) * np.linspace(-1, 1, 10))
+        ylim = plotter.axes["main"].get_ylim()
+        assert -1e-2 < ylim[0] < -1e-3 and 1e-3 < ylim[1] < 1e-2
 
-    def test_clear_line(self) -> None:
+        # small changes inside the view keep it, so blitting is not interrupted
+        plotter.update_line("data", x, np.full(10, 0.9e-3) * np.linspace(-1, 1, 10))
+        assert plotter.axes["main"].get_ylim() == ylim
+
+    @pytest.mark.parametrize("block", [1, 7])
+    def test_autoscale_tracks_bounded_line(self, plotter, block) -> None:
+        """Test that the view follows the last max_points samples, not the full history."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data", max_points=10)
+
+        x = np.arange(1000.0)
+        for start in range(0, x.size, block):
+            chunk = x[start : start + block]
+            if block == 1:
+                plotter.append_point("data", chunk[0], -chunk[0])
+            else:
+                plotter.extend_points("data", chunk, -chunk)
+
+        xlim = plotter.axes["main"].get_xlim()
+        ylim = plotter.axes["main"].get_ylim()
+        assert 980.0 < xlim[0] <= 990.0 and 999.0 <= xlim[1] < 1010.0
+        assert -1010.0 < ylim[0] <= -999.0 and -990.0 <= ylim[1] < -980.0
+
+    def test_clear_line_shrinks_view_to_remaining_lines(self, plotter) -> None:
+        """Test that clearing a line drops its bounds from the subplot."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "big")
+        plotter.add_line("main", "small")
+
+        plotter.update_line("big", np.arange(3.0), np.array([0.0, 500.0, 1000.0]))
+        plotter.update_line("small", np.arange(3.0), np.array([0.0, 0.5, 1.0]))
+        assert plotter.axes["main"].get_ylim()[1] > 1000.0
+
+        plotter.clear_line("big")
+        assert plotter.axes["main"].get_ylim()[1] < 2.0
+
+    def test_clear_line(self, plotter) -> None:
         """Test clearing a line."""
-        plotter = LivePlotter()
         plotter.create_subplot("main")
         plotter.add_line("main", "data")
 
@@ -291,23 +360,20 @@ class TestLivePlotter:
         assert len(line.get_xdata()) == 0
         assert len(line.get_ydata()) == 0
 
-        plotter.close()
-
-    def test_save_figure(self) -> None:
-        """Test saving figure to file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            plotter = LivePlotter()
-            plotter.create_subplot("main")
-            plotter.add_line("main", "data")
+    @pytest.mark.parametrize(
+        "suffix, signature", [("png", b"\x89PNG"), ("pdf", b"%PDF"), ("svg", b"<?xml")]
+    )
+    def test_save_figure(self, plotter, tmp_path, sine_wave, suffix, signature) -> None:
+        """Test saving figure to file, in the format given by the suffix."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
 
-            x = np.linspace(0, 2 * np.pi, 100)
-            plotter.update_line("data", x, np.sin(x))
+        plotter.update_line("data", *sine_wave)
 
-            filepath = Path(tmpdir) / "test_figure.png"
-            plotter.save_figure(str(filepath))
+        filepath = tmp_path / f"test_figure.{suffix}"
+        plotter.save_figure(str(filepath))
 
-            assert filepath.exists()
-            plotter.close()
+        assert filepath.read_bytes().startswith(signature)
 
     def test_error_on_missing_subplot(self) -> None:
         """Test error when adding line to non-existent subplot."""
@@ -318,16 +384,83 @@ class TestLivePlotter:
 
         plotter.close()
 
-    def test_error_on_missing_line(self) -> None:
+    def test_clear_keeps_figure(self, plotter) -> None:
+        """Test that clearing removes the subplots but keeps the figure for reuse."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
+        fig = plotter.fig
+
+        plotter.clear()
+
+        assert plotter.fig is fig
+        assert fig.axes == []
+        assert plotter.axes == {} and plotter.lines == {}
+        plotter.create_subplot("main")
+        plotter.add_line("main", "data")
+
+    def test_error_on_missing_line(self, plotter) -> None:
         """Test error when updating non-existent line."""
-        plotter = LivePlotter()
         plotter.create_subplot("main")
 
         with pytest.raises(ValueError, match="does not exist"):
             plotter.update_line("nonexistent", np.array([1]), np.array([1]))
 
+
+class TestPyQtGraphLivePlotter:
+    """Tests for the pyqtgraph backend of LivePlotter."""
+
+    @pytest.fixture
+    def plotter(self, monkeypatch):
+        """Create a plotter rendering to an offscreen Qt platform."""
+        pytest.importorskip("pyqtgraph")
+        monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+        from qeg_nmr_qua.plotting.pyqtgraph_plotter import PyQtGraphLivePlotter
+
+        plotter = PyQtGraphLivePlotter(title="Test Plot")
+        yield plotter
         plotter.close()
 
+    def test_update_and_append(self, plotter) -> None:
+        """Test that line data reaches the pyqtgraph items."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "signal", color="tab:red", label="Signal", max_points=3)
+
+        plotter.update_line("signal", np.array([0.0, 1.0]), np.array([2.0, 3.0]))
+        for i in range(2, 5):
+            plotter.append_point("signal", float(i), float(i + 2))
+
+        x_data, y_data = plotter.lines["signal"].getData()
+        assert np.array_equal(x_data, [2.0, 3.0, 4.0])
+        assert np.array_equal(y_data, [4.0, 5.0, 6.0])
+
+    def test_autorange_follows_finite_data(self, plotter) -> None:
+        """Test that the view skips NaN samples and shrinks to replaced or cleared data."""
+        plotter.create_subplot("main")
+        plotter.add_line("main", "signal")
+        plotter.add_line("main", "spike")
+        view_box = plotter.axes["main"].getViewBox()
+
+        plotter.update_line("signal", np.arange(4.0), np.array([np.nan, 10.0, 20.0, 30.0]))
+        view_box.updateAutoRange()
+        ymin, ymax = view_box.viewRange()[1]
+        assert 0.0 < ymin < 10.0 and 30.0 < ymax < 40.0
+
+        plotter.update_line("signal", np.arange(4.0), np.array([1e-3, 0.0, -1e-3, 0.0]))
+        plotter.update_line("spike", np.arange(4.0), np.array([0.0, 1000.0, 0.0, 0.0]))
+        plotter.clear_line("spike")
+        view_box.updateAutoRange()
+        assert view_box.viewRange()[1][1] < 1e-2
+
+    def test_save_figure(self, plotter, tmp_path) -> None:
+        """Test that figures are rendered to file through matplotlib."""
+        plotter.create_subplot("main", xlabel="Time (s)")
+        plotter.add_line("main", "signal", label="Signal")
+        plotter.update_line("signal", np.array([0.0, 1.0]), np.array([1.0, 0.0]))
+
+        filepath = tmp_path / "fig.png"
+        plotter.save_figure(filepath)
+        assert filepath.exists()
+
 
 class TestPackageImport:
     """Tests for package imports."""
@@ -345,3 +478,14 @@ class TestPackageImport:
         assert hasattr(qeg_nmr_qua, "OPXConfig")
         assert hasattr(qeg_nmr_qua, "DataSaver")
         assert hasattr(qeg_nmr_qua, "LivePlotter")
+
+    def test_import_does_not_load_pyplot(self) -> None:
+        """Test that pyplot is only imported once something is plotted."""
+        code = (
+            "import sys, qeg_nmr_qua, qeg_nmr_qua.plotting.live_plotter; "
+            "print('matplotlib.pyplot' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.splitlines()[-1] == "False"